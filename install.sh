@@ -177,6 +177,18 @@ setup_python_env() {
     fi
   fi
 
+  # optional: faster mpv IPC decoding, falls back to json when unavailable
+  log_info "installing orjson (optional)"
+  if [ -n "$SUDO_USER" ]; then
+    sudo -u "$SUDO_USER" "$BASE_DIR/$VENV_DIR/bin/pip" install "orjson>=3.6.0" >/dev/null 2>&1 || {
+      log_warn "orjson unavailable, using json"
+    }
+  else
+    "$BASE_DIR/$VENV_DIR/bin/pip" install "orjson>=3.6.0" >/dev/null 2>&1 || {
+      log_warn "orjson unavailable, using json"
+    }
+  fi
+
   log_ok "python environment ready"
 }
 
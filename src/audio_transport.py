@@ -1,17 +1,74 @@
-from abc import ABC, abstractmethod
-from enum import Enum
-from typing import Optional, Callable
+from __future__ import annotations
 
+import time
+from abc import abstractmethod
+from enum import IntEnum
+from typing import Callable, Tuple
 
-class PlayerState(Enum):
+
+class PlayerState(IntEnum):
     STOPPED = 0
     PLAYING = 1
     PAUSED = 2
 
 
-class AudioTransport(ABC):
+# module-level aliases: `state == PLAYING` skips the class attribute lookup
+STOPPED = PlayerState.STOPPED
+PLAYING = PlayerState.PLAYING
+PAUSED = PlayerState.PAUSED
+
+
+def _noop(*_args) -> None:
+    pass
+
+
+class _PlaybackClock:
+    # position = anchor_pos + elapsed * rate; rate is 1.0 while playing, 0.0 otherwise
+
+    __slots__ = ('anchor_t', 'anchor_pos', 'rate')
+
+    def __init__(self):
+        self.anchor_t = time.monotonic()
+        self.anchor_pos = 0.0
+        self.rate = 0.0
+
+    def resync(self, position: float, rate: float) -> None:
+        self.anchor_t = time.monotonic()
+        self.anchor_pos = position
+        self.rate = rate
+
+    def age(self) -> float:
+        return time.monotonic() - self.anchor_t
+
+    def now(self) -> float:
+        return self.anchor_pos + (time.monotonic() - self.anchor_t) * self.rate
+
+
+class AbstractMeta(type):
+    # abstractmethod enforcement without ABCMeta: object.__new__ already
+    # refuses classes with a non-empty __abstractmethods__, so isinstance/
+    # issubclass stay plain type checks (no subclass cache)
 
-    on_track_end: Optional[Callable[[], None]] = None
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        abstracts = {n for n, v in namespace.items() if getattr(v, '__isabstractmethod__', False)}
+        for base in bases:
+            for n in getattr(base, '__abstractmethods__', ()):
+                if getattr(getattr(cls, n, None), '__isabstractmethod__', False):
+                    abstracts.add(n)
+        cls.__abstractmethods__ = frozenset(abstracts)
+        return cls
+
+
+class AudioTransport(metaclass=AbstractMeta):
+
+    __slots__ = ('on_track_end', '_duration_seconds', '_track_count')
+
+    def __init__(self):
+        self.on_track_end: Callable[[], None] = _noop
+        # set by subclasses when a track is loaded, so getters skip the backend
+        self._duration_seconds: float = 0.0
+        self._track_count: int = 0
 
     @abstractmethod
     def play(self) -> None: pass
@@ -22,20 +79,25 @@ class AudioTransport(ABC):
     @abstractmethod
     def stop(self) -> None: pass
 
-    @abstractmethod
-    def seek(self, position_seconds: float) -> None: pass
+    def seek(self, position_seconds: float) -> None:
+        raise NotImplementedError
 
-    @abstractmethod
-    def get_position(self) -> float: pass
+    def get_position(self) -> float:
+        raise NotImplementedError
 
-    @abstractmethod
-    def get_duration(self) -> float: pass
+    def get_duration(self) -> float:
+        return self._duration_seconds
 
-    @abstractmethod
-    def get_state(self) -> PlayerState: pass
+    def get_state(self) -> PlayerState:
+        raise NotImplementedError
 
     def is_playing(self) -> bool:
-        return self.get_state() == PlayerState.PLAYING
+        return self.get_state() is PLAYING
+
+    def snapshot(self) -> Tuple[PlayerState, float, float]:
+        # (state, position, duration) in one call; override when the backend
+        # can answer all three in a single round-trip
+        return self.get_state(), self.get_position(), self.get_duration()
 
     def navigate_to(self, track_index: int, auto_play: bool = True) -> bool:
         return False
@@ -43,11 +105,11 @@ class AudioTransport(ABC):
     def prepare_next(self, track_index: int) -> None:
         pass
 
-    @abstractmethod
-    def get_current_track_index(self) -> int: pass
+    def get_current_track_index(self) -> int:
+        raise NotImplementedError
 
-    @abstractmethod
-    def get_track_count(self) -> int: pass
+    def get_track_count(self) -> int:
+        return self._track_count
 
     @abstractmethod
     def cleanup(self) -> None: pass
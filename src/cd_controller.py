@@ -1,9 +1,16 @@
 import logging
+import shutil
+import subprocess
+import threading
 import time
-from typing import Optional, Callable
+from enum import IntEnum
+from collections import OrderedDict
+from itertools import accumulate
+from operator import attrgetter
+from typing import Optional, Callable, Tuple
 from cd_ripper import CDRipper, CDTrack
 from cd_player import BitPerfectPlayer
-from audio_transport import PlayerState
+from audio_transport import AudioTransport, PlayerState, PLAYING
 from cd_direct_player import DirectCDPlayer
 from superdrive import SuperDriveController
 from track_sequencer import TrackSequencer, RepeatMode
@@ -12,47 +19,89 @@ import config
 logger = logging.getLogger(__name__)
 
 
+class Event(IntEnum):
+    TRACK_CHANGE = 0
+    CD_LOADED = 1
+    STATUS_CHANGE = 2
+    LOADING_PROGRESS = 3
+
+
+_EVENT_NAMES = {e.name.lower(): e for e in Event}
+
+
 class CDPlayerController:
 
+    __slots__ = (
+        'ripper', 'player', 'superdrive', 'direct_player', 'is_direct_mode',
+        '_transport', 'sequencer', 'cd_loaded',
+        '_tracks', '_total_tracks', '_cum_duration', '_total_duration', '_ram_bytes',
+        '_pcm_cache', '_pcm_cache_bytes', '_pcm_cache_budget', '_pcm_cache_lock',
+        '_last_stop_ns', 'stop_count',
+        '_listeners', '_eject_bin', '_toc_ns',
+    )
+
+    # a scan younger than this is reused by a streaming load instead of re-reading the TOC
+    TOC_TTL_NS = 30_000_000_000
+
     def __init__(self):
         self.ripper = CDRipper()
         self.player = BitPerfectPlayer(
-            data_provider=self.ripper.load_track_data
+            data_provider=self._get_pcm
         )
         self.superdrive = SuperDriveController(config.CD_DEVICE)
         self.superdrive.detect()
 
         self.direct_player: Optional[DirectCDPlayer] = None
         self.is_direct_mode: bool = False
+        self._transport: AudioTransport = self.player
 
         self.sequencer = TrackSequencer()
 
         self.cd_loaded: bool = False
-        self.last_stop_time: float = 0.0
+        self._tracks: list = []
+        self._total_tracks: int = 0
+        # _cum_duration[i] = start of track i on the disc; last entry is the disc length
+        self._cum_duration: list = [0.0]
+        self._total_duration: float = 0.0
+        self._ram_bytes: int = 0
+        self._pcm_cache: OrderedDict = OrderedDict()
+        self._pcm_cache_bytes: int = 0
+        self._pcm_cache_budget: int = 0
+        self._pcm_cache_lock = threading.Lock()
+        self._last_stop_ns: int = 0
         self.stop_count: int = 0
 
-        self._track_change_listeners = []
-        self._cd_loaded_listeners = []
-        self._status_change_listeners = []
-        self._loading_progress_listeners = []
+        self._eject_bin: Optional[str] = shutil.which('eject')
+        self._toc_ns: int = 0
+
+        # indexed by Event; tuples are replaced on registration, so _fire never
+        # iterates a list being appended to
+        self._listeners = [()] * len(Event)
 
         self.player.on_track_end = self._on_track_end
 
     def on(self, event, callback):
-        getattr(self, f'_{event}_listeners').append(callback)
+        if isinstance(event, str):
+            event = _EVENT_NAMES[event]
+        self._listeners[event] += (callback,)
 
     def _fire(self, event, *args):
-        for cb in getattr(self, f'_{event}_listeners'):
+        listeners = self._listeners[event]
+        if not listeners:
+            return
+        for cb in listeners:
             try:
                 cb(*args)
             except Exception as e:
                 logger.error(f"listener error: {e}")
 
     @property
-    def transport(self):
-        if self.is_direct_mode and self.direct_player:
-            return self.direct_player
-        return self.player
+    def transport(self) -> AudioTransport:
+        return self._transport
+
+    def _select_transport(self):
+        # call whenever is_direct_mode or direct_player changes
+        self._transport = self.direct_player if self.is_direct_mode and self.direct_player else self.player
 
     @property
     def repeat_mode(self) -> RepeatMode:
@@ -70,12 +119,24 @@ class CDPlayerController:
     def shuffle_on(self, value: bool):
         self.sequencer.shuffle_on = value
 
-    def _wake_transport(self, progress_callback: Optional[Callable] = None):
+    def _progress_dispatcher(self, progress_callback: Optional[Callable]) -> Callable:
+        # the ripper reports once per track, so every call is forwarded
+        callbacks = tuple(cb for cb in (progress_callback, *self._listeners[Event.LOADING_PROGRESS]) if cb)
+
+        def dispatch(done, total, status):
+            for cb in callbacks:
+                try:
+                    cb(done, total, status)
+                except Exception as e:
+                    logger.error(f"listener error: {e}")
+        return dispatch
+
+    def _wake_transport(self, progress: Optional[Callable] = None):
         if self.superdrive.is_superdrive and not self.superdrive.is_enabled:
             logger.info("waking SuperDrive")
-            if progress_callback:
-                progress_callback(0, 0, "waking")
-            self._fire('loading_progress', 0, 0, "waking")
+            if progress is None:
+                progress = self._progress_dispatcher(None)
+            progress(0, 0, "waking")
             self.superdrive.enable()
 
     def load(self, progress_callback: Optional[Callable] = None, extraction_level: int = None) -> tuple:
@@ -95,16 +156,16 @@ class CDPlayerController:
 
     def _load_streaming_mode(self, progress_callback: Optional[Callable] = None) -> tuple:
         logger.info("streaming mode")
+        progress = self._progress_dispatcher(progress_callback)
 
-        self._wake_transport(progress_callback)
+        self._wake_transport(progress)
 
-        if progress_callback:
-            progress_callback(0, 0, "detecting")
-        self._fire('loading_progress', 0, 0, "detecting")
+        progress(0, 0, "detecting")
 
-        success, status = self.scan()
-        if not success:
-            return (False, status)
+        if not self._toc_is_fresh():
+            success, status = self.scan()
+            if not success:
+                return (False, status)
 
         tracks = self.get_scanned_tracks()
         logger.info(f"streaming: {len(tracks)} tracks")
@@ -112,33 +173,33 @@ class CDPlayerController:
         self.direct_player = DirectCDPlayer(tracks=tracks)
         self.direct_player.on_track_end = self._on_track_end
         self.is_direct_mode = True
+        self._select_transport()
         self.cd_loaded = True
+        self._ram_bytes = 0
 
         self.sequencer.set_total_tracks(len(tracks))
+        self._set_tracks(tracks)
 
-        self.transport.navigate_to(0, auto_play=False)
+        self._transport.navigate_to(0, auto_play=False)
 
         logger.info("streaming ready")
 
-        if progress_callback:
-            progress_callback(len(tracks), len(tracks), "complete")
-        self._fire('loading_progress', len(tracks), len(tracks), "complete")
+        progress(len(tracks), len(tracks), "complete")
 
-        self._fire('cd_loaded', len(tracks))
+        self._fire(Event.CD_LOADED, len(tracks))
 
         return (True, "streaming")
 
     def _load_ram_mode(self, progress_callback: Optional[Callable] = None, extraction_level: int = None) -> tuple:
         logger.info(f"RAM mode level {extraction_level}")
+        progress = self._progress_dispatcher(progress_callback)
 
         if extraction_level is not None:
             self.ripper.set_extraction_level(extraction_level)
 
-        self._wake_transport(progress_callback)
+        self._wake_transport(progress)
 
-        if progress_callback:
-            progress_callback(0, 0, "detecting")
-        self._fire('loading_progress', 0, 0, "detecting")
+        progress(0, 0, "detecting")
 
         if not self.ripper.detect_cd():
             logger.info("no cd")
@@ -146,9 +207,7 @@ class CDPlayerController:
 
         logger.info("cd detected")
 
-        if progress_callback:
-            progress_callback(0, 0, "reading_toc")
-        self._fire('loading_progress', 0, 0, "reading_toc")
+        progress(0, 0, "reading_toc")
 
         tracks = self.ripper.read_toc()
         if not tracks:
@@ -158,111 +217,113 @@ class CDPlayerController:
         self.ripper.read_cdtext()
         logger.info(f"TOC: {len(tracks)} tracks")
 
-        total_duration = sum(t.duration_seconds for t in tracks)
-        required_ram = config.estimate_cd_ram_usage_mb(total_duration)
+        required_ram = config.estimate_cd_ram_usage_mb(self.ripper.total_duration)
         ram_ok, available_ram, ram_msg = config.check_ram_availability(required_ram)
 
         if not ram_ok:
             logger.error(f"RAM err: {ram_msg}")
-            if progress_callback:
-                progress_callback(0, 0, "error")
-            self._fire('loading_progress', 0, 0, "error")
+            progress(0, 0, "error")
             return (False, "ram_error")
 
-        logger.debug(f"RAM: {required_ram:.0f} MB needed")
+        logger.debug("RAM: %.0f MB needed", required_ram)
 
-        if progress_callback:
-            progress_callback(0, len(tracks), "extracting")
-        self._fire('loading_progress', 0, len(tracks), "extracting")
+        progress(0, len(tracks), "extracting")
 
-        def combined_progress_cb(track_num, total_tracks, status):
-            if progress_callback:
-                progress_callback(track_num, total_tracks, status)
-            self._fire('loading_progress', track_num, total_tracks, status)
-
-        if not self.ripper.rip_to_ram(combined_progress_cb):
+        if not self.ripper.rip_to_ram(progress):
             logger.error("extraction failed")
             return (False, "extraction_error")
 
         logger.info("extraction done")
+        self._ram_bytes = self.ripper.total_ripped_bytes
 
-        if progress_callback:
-            progress_callback(len(tracks), len(tracks), "complete")
-        self._fire('loading_progress', len(tracks), len(tracks), "complete")
+        progress(len(tracks), len(tracks), "complete")
 
         self.cd_loaded = True
         self.is_direct_mode = False
-        self.last_stop_time = 0.0
+        self._select_transport()
+        self._last_stop_ns = 0
         self.stop_count = 0
 
-        self.player = BitPerfectPlayer(
-            data_provider=self.ripper.load_track_data,
-            track_count=len(tracks)
-        )
-        self.player.on_track_end = self._on_track_end
+        # only now: the old player may still be reading while the new disc is ripped
+        self._clear_pcm_cache()
+        headroom_mb = max(0.0, available_ram - required_ram)
+        self._pcm_cache_budget = int(headroom_mb * config.PCM_CACHE_FRACTION * 1024 * 1024)
+        self.player.reconfigure(data_provider=self._get_pcm, track_count=len(tracks))
 
         self.sequencer.set_total_tracks(len(tracks))
+        self._set_tracks(tracks)
 
-        self.transport.navigate_to(0, auto_play=False)
+        self._transport.navigate_to(0, auto_play=False)
         self._preload_next()
 
         logger.info("cd loaded, ready")
 
-        self._fire('cd_loaded', len(tracks))
+        self._fire(Event.CD_LOADED, len(tracks))
 
         return (True, "ok")
 
+    def _set_tracks(self, tracks: list):
+        self._tracks = tracks
+        self._total_tracks = len(tracks)
+        self._cum_duration = list(accumulate(map(attrgetter('duration_seconds'), tracks), initial=0.0))
+        self._total_duration = self._cum_duration[-1]
+
     def _preload_next(self):
         next_idx = self.sequencer.get_next_for_preload()
-        self.transport.prepare_next(next_idx if next_idx is not None else -1)
+        self._transport.prepare_next(next_idx if next_idx is not None else -1)
 
     def _on_track_end(self):
+        transport = self._transport
         new_idx = self.sequencer.advance()
         if new_idx is None:
             self.sequencer.goto(0)
-            self.transport.navigate_to(0, auto_play=False)
-            self._fire('status_change', 'disc_end')
+            transport.navigate_to(0, auto_play=False)
+            self._fire(Event.STATUS_CHANGE, 'disc_end')
             return
 
-        if self.transport.get_current_track_index() == new_idx:
-            logger.info(f"gapless → track {new_idx + 1}")
+        if transport.get_current_track_index() == new_idx:
+            logger.info("gapless → track %d", new_idx + 1)
         else:
-            self.transport.navigate_to(new_idx, auto_play=True)
-            logger.info(f"redirect → track {new_idx + 1}")
+            transport.navigate_to(new_idx, auto_play=True)
+            logger.info("redirect → track %d", new_idx + 1)
 
-        self._fire('track_change', new_idx + 1, self.get_total_tracks())
+        self._fire(Event.TRACK_CHANGE, new_idx + 1, self._total_tracks)
         self._preload_next()
 
     def play(self):
         if not self.cd_loaded:
             return
-        self.transport.play()
+        # any other transport action ends a double-stop sequence
+        self.stop_count = 0
+        self._transport.play()
         logger.info("[>] play")
 
     def pause(self):
-        if self.transport.get_state() == PlayerState.PLAYING:
-            self.transport.pause()
+        transport = self._transport
+        if transport.get_state() == PLAYING:
+            transport.pause()
             logger.info("[||] pause")
 
     def stop(self):
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
 
-        if current_time - self.last_stop_time < 3.0:
+        if self.stop_count and now_ns - self._last_stop_ns < 3_000_000_000:
             self.stop_count += 1
             if self.stop_count >= 2:
                 self.sequencer.goto(0)
                 self.stop_count = 0
-                self.transport.navigate_to(0, auto_play=False)
-                self.transport.stop()
-                self._fire('track_change', 1, self.get_total_tracks())
+                transport = self._transport
+                transport.navigate_to(0, auto_play=False)
+                transport.stop()
+                self._fire(Event.TRACK_CHANGE, 1, self._total_tracks)
                 logger.info("[stop] reset to track 1")
                 return
         else:
             self.stop_count = 1
 
-        self.last_stop_time = current_time
+        self._last_stop_ns = now_ns
 
-        self.transport.stop()
+        self._transport.stop()
         logger.info("[stop]")
 
     def next(self):
@@ -273,59 +334,60 @@ class CDPlayerController:
         if new_idx is None:
             return
 
-        was_playing = self.transport.is_playing()
-        self.transport.navigate_to(new_idx, auto_play=was_playing)
-        self._fire('track_change', new_idx + 1, self.get_total_tracks())
-        self._preload_next()
-        logger.info(f"[>>] track {new_idx + 1}/{self.get_total_tracks()}")
+        self._change_track(new_idx, ">>")
 
     def prev(self):
         if not self.cd_loaded:
             return
 
-        if self.transport.get_position() <= 2.0:
+        transport = self._transport
+        if transport.get_position() <= 2.0:
             prev_idx = self.sequencer.retreat()
             if prev_idx is not None:
-                was_playing = self.transport.is_playing()
-                self.transport.navigate_to(prev_idx, auto_play=was_playing)
-                self._fire('track_change', prev_idx + 1, self.get_total_tracks())
-                self._preload_next()
-                logger.info(f"[<<] track {prev_idx + 1}/{self.get_total_tracks()}")
+                self._change_track(prev_idx, "<<")
             else:
-                self.transport.seek(0)
+                transport.seek(0)
         else:
-            self.transport.seek(0)
+            transport.seek(0)
 
     def goto(self, track_num: int):
         if not self.cd_loaded:
             return
 
-        total = self.get_total_tracks()
+        total = self._total_tracks
         if not (1 <= track_num <= total):
             return
 
         self.sequencer.goto(track_num - 1)
-        was_playing = self.transport.is_playing()
-        self.transport.navigate_to(track_num - 1, auto_play=was_playing)
-        self._fire('track_change', track_num, total)
+        self._change_track(track_num - 1, "->")
+
+    def _change_track(self, index: int, tag: str):
+        self.stop_count = 0
+        transport = self._transport
+        transport.navigate_to(index, auto_play=transport.is_playing())
+        total = self._total_tracks
+        self._fire(Event.TRACK_CHANGE, index + 1, total)
         self._preload_next()
-        logger.info(f"[->] track {track_num}/{total}")
+        logger.info("[%s] track %d/%d", tag, index + 1, total)
 
     def seek(self, position_seconds: float):
-        self.transport.seek(position_seconds)
+        self._transport.seek(position_seconds)
 
     def get_current_track_num(self) -> int:
         return self.sequencer.current_index + 1
 
     def get_total_tracks(self) -> int:
-        return self.sequencer.total_tracks if self.cd_loaded else 0
+        return self._total_tracks if self.cd_loaded else 0
 
     def get_track_info(self, track_num: int = None) -> Optional[CDTrack]:
         if not self.cd_loaded:
             return None
         if track_num is None:
-            track_num = self.sequencer.current_index + 1
-        return self.ripper.get_track_info(track_num)
+            idx = self.sequencer.current_index
+            return self._tracks[idx] if 0 <= idx < len(self._tracks) else None
+        if 1 <= track_num <= self._total_tracks:
+            return self._tracks[track_num - 1]
+        return None
 
     def get_disc_title(self) -> str:
         return self.ripper.disc_title if self.cd_loaded else ""
@@ -342,29 +404,34 @@ class CDPlayerController:
         return track.artist if track and track.artist else ""
 
     def get_position(self) -> float:
-        return self.transport.get_position()
+        return self._transport.get_position()
 
     def get_duration(self) -> float:
-        return self.transport.get_duration()
+        return self._transport.get_duration()
 
     def get_state(self) -> PlayerState:
-        return self.transport.get_state()
+        return self._transport.get_state()
+
+    def snapshot(self) -> Tuple[PlayerState, float, float]:
+        return self._transport.snapshot()
 
     def is_cd_loaded(self) -> bool:
         return self.cd_loaded
 
     def get_all_tracks(self) -> list:
-        return self.ripper.tracks if self.cd_loaded else []
+        return self._tracks if self.cd_loaded else []
 
     def get_total_duration(self) -> float:
         if not self.cd_loaded:
             return 0.0
-        return sum(t.duration_seconds for t in self.ripper.tracks)
+        return self._total_duration
 
     def get_current_track_duration(self) -> float:
-        track_info = self.get_track_info()
-        if track_info:
-            return track_info.duration_seconds
+        if not self.cd_loaded:
+            return 0.0
+        idx = self.sequencer.current_index
+        if 0 <= idx < len(self._tracks):
+            return self._tracks[idx].duration_seconds
         return 0.0
 
     def get_track_remaining_time(self) -> float:
@@ -376,41 +443,55 @@ class CDPlayerController:
     def get_disc_remaining_time(self) -> float:
         if not self.cd_loaded:
             return 0.0
-        current_remaining = self.get_track_remaining_time()
-        remaining_tracks_time = 0.0
-        for i in range(self.sequencer.current_index + 1, len(self.ripper.tracks)):
-            remaining_tracks_time += self.ripper.tracks[i].duration_seconds
-        return current_remaining + remaining_tracks_time
+        return max(0.0, self._total_duration - self.get_disc_position())
 
     def get_disc_position(self) -> float:
         if not self.cd_loaded:
             return 0.0
-        previous_tracks_time = sum(
-            self.ripper.tracks[i].duration_seconds
-            for i in range(self.sequencer.current_index)
-        )
-        current_position = self.get_position()
-        return previous_tracks_time + current_position
+        return self._cum_duration[self.sequencer.current_index] + self.get_position()
+
+    def _get_pcm(self, track_num: int) -> Optional[bytes]:
+        with self._pcm_cache_lock:
+            data = self._pcm_cache.get(track_num)
+            if data is not None:
+                self._pcm_cache.move_to_end(track_num)
+                return data
+
+        data = self.ripper.load_track_data(track_num)
+        if data is None or len(data) > self._pcm_cache_budget:
+            return data
+
+        with self._pcm_cache_lock:
+            if track_num not in self._pcm_cache:
+                self._pcm_cache[track_num] = data
+                self._pcm_cache_bytes += len(data)
+                while self._pcm_cache_bytes > self._pcm_cache_budget:
+                    _, evicted = self._pcm_cache.popitem(last=False)
+                    self._pcm_cache_bytes -= len(evicted)
+        return data
+
+    def _clear_pcm_cache(self):
+        with self._pcm_cache_lock:
+            self._pcm_cache.clear()
+            self._pcm_cache_bytes = 0
 
     def get_ram_usage_mb(self) -> float:
         if not self.cd_loaded:
             return 0.0
-        import os
-        total_bytes = 0
-        for track in self.ripper.tracks:
-            filepath = self.ripper._get_track_filepath(track.number)
-            if os.path.exists(filepath):
-                total_bytes += os.path.getsize(filepath)
-        return total_bytes / (1024 * 1024)
+        return self._ram_bytes / (1024 * 1024)
 
     def repeat(self) -> RepeatMode:
         mode = self.sequencer.cycle_repeat()
+        if self.cd_loaded:
+            self._preload_next()
         return mode
 
     def shuffle(self) -> bool:
         if not self.cd_loaded:
             return False
-        return self.sequencer.toggle_shuffle()
+        shuffle_on = self.sequencer.toggle_shuffle()
+        self._preload_next()
+        return shuffle_on
 
     def scan(self) -> tuple:
         self._wake_transport()
@@ -420,9 +501,14 @@ class CDPlayerController:
             return (False, "no_disc")
 
         self.ripper.read_cdtext()
+        self._toc_ns = time.monotonic_ns()
         logger.info(f"scan: {len(tracks)} tracks")
         return (True, "ok")
 
+    def _toc_is_fresh(self) -> bool:
+        return (self._toc_ns != 0 and bool(self.ripper.tracks)
+                and time.monotonic_ns() - self._toc_ns < self.TOC_TTL_NS)
+
     def get_scanned_tracks(self) -> list:
         return self.ripper.tracks if self.ripper.tracks else []
 
@@ -430,31 +516,52 @@ class CDPlayerController:
         return self.player.verify_bit_perfect_config()
 
     def eject(self):
-        self.transport.stop()
+        self._transport.stop()
 
         if self.is_direct_mode and self.direct_player:
             self.direct_player.cleanup()
             self.direct_player = None
             self.is_direct_mode = False
+            self._select_transport()
 
         self.player.stop()
         self.ripper.cleanup()
         self.cd_loaded = False
+        self._set_tracks([])
+        self._ram_bytes = 0
+        self._clear_pcm_cache()
+        self._toc_ns = 0
 
-        import subprocess
-        try:
-            subprocess.run(['eject', self.ripper.device], timeout=5)
-        except Exception:
-            logger.warning("eject failed")
+        if self._eject_bin:
+            try:
+                proc = subprocess.Popen([self._eject_bin, self.ripper.device],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                threading.Thread(target=self._reap_eject, args=(proc,), daemon=True, name="EjectReap").start()
+            except Exception:
+                logger.warning("eject failed")
+        else:
+            logger.warning("eject binary not found")
 
         logger.info("ejected")
 
+    def _reap_eject(self, proc: subprocess.Popen):
+        try:
+            if proc.wait(timeout=5) != 0:
+                logger.warning("eject failed")
+        except subprocess.TimeoutExpired:
+            logger.warning("eject timed out")
+
     def cleanup(self):
         if self.is_direct_mode and self.direct_player:
             self.direct_player.cleanup()
             self.direct_player = None
             self.is_direct_mode = False
+            self._select_transport()
 
         self.player.cleanup()
         self.ripper.cleanup()
+        self._set_tracks([])
+        self._ram_bytes = 0
+        self._clear_pcm_cache()
+        self._toc_ns = 0
         logger.debug("cleanup done")
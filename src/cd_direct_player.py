@@ -6,78 +6,142 @@ import time
 import logging
 import tempfile
 import os
-from typing import Optional, List, Callable
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import Optional, List
 import config
-from audio_transport import AudioTransport, PlayerState
+from audio_transport import AudioTransport, PlayerState, _PlaybackClock
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _encode_command(command) -> bytes:
+    return json.dumps({"command": command}).encode() + b'\n'
+
+
+# fixed mpv argv; only the ALSA device and IPC socket are added per spawn
+_MPV_ARGS = (
+    'mpv',
+    '--idle=yes',
+    '--no-video',
+    # ALSA direct
+    '--ao=alsa',
+    # CD format (44.1kHz/16bit/stereo)
+    '--audio-samplerate=44100',
+    '--audio-format=s16',
+    '--audio-channels=stereo',
+    # bit-perfect: no processing
+    '--audio-pitch-correction=no',
+    '--audio-normalize-downmix=no',
+    '--alsa-resample=no',
+    '--replaygain=no',
+    '--af=',
+    '--audio-swresample-o=',
+    '--volume=100',
+    '--volume-max=100',
+    '--gapless-audio=yes',
+    # buffer for CD streaming on RPi
+    '--audio-buffer=2',
+    # read ahead across chapter boundaries so the drive stays ahead of the next track
+    '--cache=yes',
+    '--cache-secs=15',
+    '--demuxer-readahead-secs=5',
+    '--cdda-paranoia=0',
+    '--no-terminal',
+    '--really-quiet',
+)
+
+_UNPAUSE_CMD = _encode_command(["set_property", "pause", False])
+
+# get_property requests are fixed byte strings; only replies need decoding
+_GET_PROPERTY_CMDS = {
+    prop: _encode_command(["get_property", prop])
+    for prop in ("time-pos", "chapter", "eof-reached")
+}
+
 
 class DirectCDPlayer(AudioTransport):
 
+    # max age of the extrapolated position before re-reading time-pos from mpv;
+    # CD audio advances at 1 s/s, so drift over a few seconds is negligible
+    CLOCK_RESYNC = 3.0
+    IPC_TIMEOUT = 0.1
+    # upper bound on waiting for mpv to open the disc before seeking to a chapter
+    LOAD_TIMEOUT = 3.0
+    # silence on the event connection after which time-pos is re-read; below
+    # CLOCK_RESYNC so the monitor keeps the clock fresh and get_position never asks
+    EVENT_KEEPALIVE = 2.5
+    _OBSERVE_CMDS = (
+        b'{"command":["observe_property",1,"chapter"]}\n'
+        b'{"command":["observe_property",2,"eof-reached"]}\n'
+    )
+
+    __slots__ = (
+        'cd_device', 'alsa_device', 'tracks', 'current_track', 'state',
+        '_process', '_ipc_dir', '_ipc_socket', '_ipc_conn', '_ipc_lock', '_ipc_buf', '_ipc_rx',
+        '_monitor_thread', '_monitor_conn', '_stop_event', '_callback_pool',
+        '_playback_started', '_clock',
+        '_cd_loaded_in_mpv', '_chapter_starts', '_chapter_start',
+    )
+
     def __init__(self, device: str = None, tracks: List = None):
+        super().__init__()
         self.cd_device = config.CD_DEVICE
         self.alsa_device = device or config.ALSA_DEVICE
         self.tracks = tracks or []
+        self._track_count = len(self.tracks)
 
         self.current_track = 0
         self.state = PlayerState.STOPPED
 
         self._process: Optional[subprocess.Popen] = None
+        self._ipc_dir: Optional[str] = None
         self._ipc_socket: Optional[str] = None
         self._ipc_conn: Optional[socket.socket] = None
         self._ipc_lock = threading.Lock()
+        self._ipc_buf = bytearray()
+        self._ipc_rx = memoryview(bytearray(4096))
         self._monitor_thread: Optional[threading.Thread] = None
+        self._monitor_conn: Optional[socket.socket] = None
         self._stop_event = threading.Event()
+        # one worker: track-end callbacks run in order, without a thread spawn per boundary
+        self._callback_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TrackEndCB")
 
-        self._pause_time: float = 0
         self._playback_started: bool = False
-        self._cached_position: float = 0.0
-        self._last_position_update: float = 0.0
+        self._clock = _PlaybackClock()
         self._cd_loaded_in_mpv: bool = False
 
-        self.on_track_end: Optional[Callable] = None
-
         self._chapter_starts: List[float] = self._build_chapter_starts()
+        self._chapter_start: float = 0.0
 
-        logger.debug(f"STREAM: cd={self.cd_device}, alsa={self.alsa_device}, tracks={len(self.tracks)}")
+        logger.debug("STREAM: cd=%s, alsa=%s, tracks=%d", self.cd_device, self.alsa_device, len(self.tracks))
 
     def _ensure_mpv(self):
         if self._process and self._process.poll() is None:
             return True
 
-        self._ipc_dir = tempfile.mkdtemp(prefix='mpv_')
+        self._close_ipc_conn()
+        try:
+            # tmpfs: creating the socket never touches the SD card
+            self._ipc_dir = tempfile.mkdtemp(prefix='mpv_', dir='/dev/shm')
+        except OSError:
+            self._ipc_dir = tempfile.mkdtemp(prefix='mpv_')
         self._ipc_socket = os.path.join(self._ipc_dir, 'socket.sock')
 
-        cmd = [
-            'mpv',
-            '--idle=yes',
-            '--no-video',
-            # ALSA direct
-            '--ao=alsa',
+        cmd = (
+            *_MPV_ARGS,
             f'--audio-device=alsa/{self.alsa_device}',
-            # CD format (44.1kHz/16bit/stereo)
-            '--audio-samplerate=44100',
-            '--audio-format=s16',
-            '--audio-channels=stereo',
-            # bit-perfect: no processing
-            '--audio-pitch-correction=no',
-            '--audio-normalize-downmix=no',
-            '--alsa-resample=no',
-            '--replaygain=no',
-            '--af=',
-            '--audio-swresample-o=',
-            '--volume=100',
-            '--volume-max=100',
-            '--gapless-audio=yes',
-            # buffer for CD streaming on RPi
-            '--audio-buffer=2',
-            '--demuxer-readahead-secs=5',
-            '--cdda-paranoia=0',
-            '--no-terminal',
-            '--really-quiet',
             f'--input-ipc-server={self._ipc_socket}',
-        ]
+        )
 
         logger.debug("STREAM: mpv starting")
 
@@ -87,34 +151,41 @@ class DirectCDPlayer(AudioTransport):
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
-            for i in range(30):
-                if os.path.exists(self._ipc_socket):
-                    time.sleep(0.1)
-                    logger.debug(f"STREAM: IPC ready ({(i+1)*0.1:.1f}s)")
+            # connecting is the readiness check: it fails fast (no socket file,
+            # or not listening yet) and succeeds as soon as mpv listens
+            start = time.monotonic()
+            while time.monotonic() - start < 3.0:
+                if self._ensure_ipc_conn(log_errors=False):
+                    logger.debug("STREAM: IPC ready (%.2fs)", time.monotonic() - start)
                     return True
-                time.sleep(0.1)
+                if self._process.poll() is not None:
+                    logger.error("STREAM: mpv exited on start")
+                    return False
+                time.sleep(0.01)
             logger.warning("STREAM: IPC timeout 3s")
             return True
         except Exception as e:
             logger.error(f"STREAM: mpv err: {e}")
             return False
 
-    def _ensure_ipc_conn(self) -> bool:
+    def _ensure_ipc_conn(self, log_errors: bool = True) -> bool:
         if self._ipc_conn:
             return True
         if not self._ipc_socket:
             return False
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            self._ipc_conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self._ipc_conn.settimeout(0.1)
-            self._ipc_conn.connect(self._ipc_socket)
-            self._ipc_conn.setblocking(False)
-            logger.debug("STREAM: IPC connected")
-            return True
-        except Exception as e:
-            logger.debug(f"STREAM: IPC err: {e}")
-            self._ipc_conn = None
+            conn.settimeout(self.IPC_TIMEOUT)
+            conn.connect(self._ipc_socket)
+        except OSError as e:
+            conn.close()
+            if log_errors:
+                logger.debug("STREAM: IPC err: %s", e)
             return False
+        self._ipc_conn = conn
+        del self._ipc_buf[:]
+        logger.debug("STREAM: IPC connected")
+        return True
 
     def _close_ipc_conn(self):
         if self._ipc_conn:
@@ -123,58 +194,130 @@ class DirectCDPlayer(AudioTransport):
             except Exception:
                 pass
             self._ipc_conn = None
+        del self._ipc_buf[:]
+
+    @staticmethod
+    def _read_message(conn: socket.socket, buf: bytearray, rx: memoryview) -> dict:
+        # one newline-framed JSON message; a partial line stays in buf for the next call
+        while True:
+            nl = buf.find(b'\n')
+            if nl >= 0:
+                msg = _json_loads(buf[:nl])
+                del buf[:nl + 1]
+                return msg
+            n = conn.recv_into(rx)
+            if not n:
+                raise ConnectionError("mpv closed IPC")
+            buf += rx[:n]
+
+    def _read_reply(self) -> dict:
+        # mpv interleaves event lines with command replies on the same connection
+        while True:
+            msg = self._read_message(self._ipc_conn, self._ipc_buf, self._ipc_rx)
+            if "event" not in msg:
+                return msg
+
+    def _open_event_conn(self) -> Optional[socket.socket]:
+        # separate client for property-change pushes, so command replies never wait behind events
+        if not self._ipc_socket:
+            return None
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.settimeout(self.IPC_TIMEOUT)
+            conn.connect(self._ipc_socket)
+            conn.sendall(self._OBSERVE_CMDS)
+            conn.settimeout(self.EVENT_KEEPALIVE)
+        except OSError as e:
+            conn.close()
+            logger.debug("STREAM: IPC err: %s", e)
+            return None
+        return conn
+
+    def _send_ipc_raw(self, payload: bytes, count: int) -> list:
+        # mpv answers one client's commands in order, so N requests share one write
+        with self._ipc_lock:
+            if not self._ensure_ipc_conn():
+                return [{"error": "no connection"}] * count
+            try:
+                self._ipc_conn.sendall(payload)
+                return [self._read_reply() for _ in range(count)]
+            except (OSError, ValueError) as e:
+                # drop the connection so a late reply can't be read as the next answer
+                logger.debug("STREAM: IPC err: %s", e)
+                self._close_ipc_conn()
+                return [{"error": str(e)}] * count
 
     def _send_ipc(self, command: list) -> dict:
-        if not self._ipc_socket:
-            return {"error": "no socket"}
+        return self._send_ipc_raw(_encode_command(command), 1)[0]
 
+    def _send_ipc_until(self, command: list, event: str, timeout: float) -> dict:
+        # returns the command's reply once `event` has also arrived, or after timeout
         with self._ipc_lock:
-            if self._ensure_ipc_conn():
-                try:
-                    msg = json.dumps({"command": command}) + "\n"
-                    self._ipc_conn.setblocking(True)
-                    self._ipc_conn.settimeout(0.1)
-                    self._ipc_conn.send(msg.encode())
-                    response = self._ipc_conn.recv(4096).decode('utf-8', errors='ignore')
-                    self._ipc_conn.setblocking(False)
-                    return json.loads(response.strip().split('\n')[0])
-                except Exception as e:
-                    logger.debug(f"STREAM: IPC reconnecting: {e}")
-                    self._close_ipc_conn()
-
+            if not self._ensure_ipc_conn():
+                return {"error": "no connection"}
+            conn = self._ipc_conn
+            reply = None
             try:
-                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                sock.settimeout(0.1)
-                sock.connect(self._ipc_socket)
-                msg = json.dumps({"command": command}) + "\n"
-                sock.send(msg.encode())
-                response = sock.recv(4096).decode('utf-8', errors='ignore')
-                sock.close()
-                return json.loads(response.strip().split('\n')[0])
-            except Exception as e:
-                logger.debug(f"STREAM: IPC err: {e}")
+                conn.sendall(_encode_command(command))
+                seen = False
+                deadline = time.monotonic() + timeout
+                while reply is None or (not seen and reply.get("error") == "success"):
+                    if reply is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        conn.settimeout(remaining)
+                    msg = self._read_message(conn, self._ipc_buf, self._ipc_rx)
+                    if "event" not in msg:
+                        reply = msg
+                    elif msg["event"] == event:
+                        seen = True
+                if not seen:
+                    logger.debug("STREAM: no %s after %.1fs", event, timeout)
+                conn.settimeout(self.IPC_TIMEOUT)
+                return reply
+            except socket.timeout:
+                if reply is not None:
+                    # only the event was late; nothing is pending on the connection
+                    conn.settimeout(self.IPC_TIMEOUT)
+                    return reply
+                self._close_ipc_conn()
+                return {"error": "timeout"}
+            except (OSError, ValueError) as e:
+                logger.debug("STREAM: IPC err: %s", e)
+                self._close_ipc_conn()
                 return {"error": str(e)}
 
     def _get_property(self, prop: str):
-        result = self._send_ipc(["get_property", prop])
-        return result.get("data")
+        cmd = _GET_PROPERTY_CMDS.get(prop) or _encode_command(["get_property", prop])
+        return self._send_ipc_raw(cmd, 1)[0].get("data")
 
     def _build_chapter_starts(self) -> List[float]:
-        starts = [0.0]
-        cumulative = 0.0
-        for track in self.tracks:
-            if hasattr(track, 'duration_seconds'):
-                cumulative += track.duration_seconds
-            starts.append(cumulative)
-        return starts
-
-    def _get_chapter_start(self, track_num: int) -> float:
-        if 1 <= track_num <= len(self._chapter_starts):
-            return self._chapter_starts[track_num - 1]
-        return 0.0
+        return list(accumulate((getattr(t, 'duration_seconds', 0.0) for t in self.tracks), initial=0.0))
+
+    def _track_at(self, pos: float) -> int:
+        # 1-based track holding absolute disc position pos
+        return bisect_right(self._chapter_starts, pos, 1, len(self._chapter_starts) - 1)
+
+    def _set_current_track(self, track_num: int):
+        # chapter start is cached with the track so position reads are one attribute load
+        self.current_track = track_num
+        if 1 <= track_num <= len(self.tracks):
+            self._duration_seconds = getattr(self.tracks[track_num - 1], 'duration_seconds', 0.0)
+            self._chapter_start = self._chapter_starts[track_num - 1]
+        else:
+            self._duration_seconds = 0.0
+            self._chapter_start = 0.0
 
     def _stop_monitor_thread(self):
         self._stop_event.set()
+        conn = self._monitor_conn
+        if conn:
+            # wakes the monitor's blocking read right away
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
         if self._monitor_thread and self._monitor_thread.is_alive():
             if threading.current_thread() != self._monitor_thread:
                 self._monitor_thread.join(timeout=0.2)
@@ -182,7 +325,7 @@ class DirectCDPlayer(AudioTransport):
     def _monitor_playback(self):
         logger.debug("STREAM: monitor started")
 
-        chapter_start = self._get_chapter_start(self.current_track)
+        chapter_start = self._chapter_start
 
         start_wait = time.time()
         while not self._stop_event.is_set():
@@ -190,9 +333,10 @@ class DirectCDPlayer(AudioTransport):
             if pos is not None:
                 track_pos = pos - chapter_start
                 if track_pos > 0.1:
+                    self._clock.resync(track_pos, 1.0)
                     if not self._playback_started:
                         self._playback_started = True
-                        logger.debug(f"STREAM: audio started, track {self.current_track}")
+                        logger.debug("STREAM: audio started, track %d", self.current_track)
                     break
 
             if time.time() - start_wait > 20:
@@ -206,38 +350,58 @@ class DirectCDPlayer(AudioTransport):
         if self._stop_event.wait(timeout=0.2):
             return
 
+        events = self._open_event_conn()
+        if events is None:
+            logger.warning("STREAM: event connection failed")
+            return
+        self._monitor_conn = events
+        buf = bytearray()
+        rx = memoryview(bytearray(4096))
+
         expected_chapter = self.current_track - 1
-        while not self._stop_event.is_set():
-            chapter = self._get_property("chapter")
-
-            if chapter is not None and chapter != expected_chapter:
-                new_track = chapter + 1
-                logger.info(f"STREAM: chapter {new_track}")
-                self.current_track = new_track
-                expected_chapter = chapter
-
-                if self.on_track_end:
-                    threading.Thread(
-                        target=self.on_track_end,
-                        daemon=True,
-                        name="TrackAdvanceCB"
-                    ).start()
-                continue
-
-            eof = self._get_property("eof-reached")
-            if eof is True:
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    msg = self._read_message(events, buf, rx)
+                except socket.timeout:
+                    # quiet between boundaries: re-anchor the clock now and then
+                    pos = self._get_property("time-pos")
+                    if pos is not None and self._track_at(pos) == self.current_track:
+                        # keep the current rate: a pause may land between the read and here
+                        self._clock.resync(pos - self._chapter_start, self._clock.rate)
+                    continue
+                except (OSError, ValueError) as e:
+                    if not self._stop_event.is_set():
+                        logger.debug("STREAM: event connection lost: %s", e)
+                    break
+
+                event = msg.get("event")
+                if event == "property-change":
+                    name = msg.get("name")
+                    data = msg.get("data")
+                    if name == "chapter":
+                        if data is not None and data != expected_chapter:
+                            new_track = data + 1
+                            logger.info(f"STREAM: chapter {new_track}")
+                            self._set_current_track(new_track)
+                            self._clock.resync(0.0, 1.0)
+                            expected_chapter = data
+
+                            self._callback_pool.submit(self.on_track_end)
+                        continue
+                    if name != "eof-reached" or data is not True:
+                        continue
+                elif event != "end-file" or msg.get("reason") != "eof":
+                    continue
+
                 self.state = PlayerState.STOPPED
                 self._playback_started = False
                 logger.info("STREAM: EOF")
-                if self.on_track_end:
-                    threading.Thread(
-                        target=self.on_track_end,
-                        daemon=True,
-                        name="DiscEndCB"
-                    ).start()
+                self._callback_pool.submit(self.on_track_end)
                 break
-
-            self._stop_event.wait(timeout=0.3)
+        finally:
+            self._monitor_conn = None
+            events.close()
 
         logger.debug("STREAM: monitor stopped")
 
@@ -252,18 +416,23 @@ class DirectCDPlayer(AudioTransport):
             return False
 
         self._stop_event.clear()
-        self.current_track = track_num
+        self._set_current_track(track_num)
         self.state = PlayerState.PLAYING
         self._playback_started = False
-        self._cached_position = 0.0
-        self._last_position_update = 0.0
+        self._clock.resync(0.0, 0.0)
 
+        # mpv keeps `pause` across seeks and files, so it is cleared in the same write
+        seek_cmds = _encode_command(["set_property", "chapter", track_num - 1]) + _UNPAUSE_CMD
         if self._cd_loaded_in_mpv:
-            logger.debug(f"STREAM: chapter seek {track_num - 1}")
-            self._send_ipc(["set_property", "chapter", track_num - 1])
+            logger.debug("STREAM: chapter seek %d", track_num - 1)
+            self._send_ipc_raw(seek_cmds, 2)
         else:
-            cd_url = f'cdda://{self.cd_device}'
-            result = self._send_ipc(["loadfile", cd_url, "replace"])
+            load_cmd = ["loadfile", f'cdda://{self.cd_device}', "replace"]
+            if track_num > 1:
+                # chapters exist only once mpv has opened the disc
+                result = self._send_ipc_until(load_cmd, "file-loaded", self.LOAD_TIMEOUT)
+            else:
+                result = self._send_ipc_raw(_encode_command(load_cmd) + _UNPAUSE_CMD, 2)[0]
             if result.get("error") != "success":
                 logger.error(f"STREAM: loadfile err: {result}")
                 self.state = PlayerState.STOPPED
@@ -272,12 +441,7 @@ class DirectCDPlayer(AudioTransport):
             self._cd_loaded_in_mpv = True
 
             if track_num > 1:
-                for _ in range(15):
-                    time.sleep(0.1)
-                    ch = self._get_property("chapter")
-                    if ch is not None:
-                        break
-                self._send_ipc(["set_property", "chapter", track_num - 1])
+                self._send_ipc_raw(seek_cmds, 2)
 
         logger.info(f"STREAM: track {track_num}")
 
@@ -291,21 +455,24 @@ class DirectCDPlayer(AudioTransport):
         return True
 
     def play(self):
-        if self.state == PlayerState.PAUSED:
+        state = self.state
+        if state is PlayerState.PAUSED:
             self.resume()
-        elif self.state == PlayerState.STOPPED and self.current_track > 0:
+        elif state is PlayerState.STOPPED and self.current_track > 0:
             self.play_track(self.current_track)
 
     def pause(self):
         if self.state == PlayerState.PLAYING:
-            self._pause_time = self.get_position()
+            pause_time = self.get_position()
             self._send_ipc(["set_property", "pause", True])
+            self._clock.resync(pause_time, 0.0)
             self.state = PlayerState.PAUSED
-            logger.debug(f"STREAM: paused at {self._pause_time:.1f}s")
+            logger.debug("STREAM: paused at %.1fs", pause_time)
 
     def resume(self):
         if self.state == PlayerState.PAUSED:
             self._send_ipc(["set_property", "pause", False])
+            self._clock.resync(self._clock.now(), 1.0)
             self.state = PlayerState.PLAYING
             logger.debug("STREAM: resumed")
 
@@ -314,9 +481,11 @@ class DirectCDPlayer(AudioTransport):
 
         if self._process:
             self._send_ipc(["stop"])
+            # "stop" unloads the disc; the next play_track has to loadfile again
+            self._cd_loaded_in_mpv = False
 
         self.state = PlayerState.STOPPED
-        self._pause_time = 0
+        self._clock.resync(0.0, 0.0)
         self._playback_started = False
         logger.debug("STREAM: stopped")
 
@@ -326,15 +495,12 @@ class DirectCDPlayer(AudioTransport):
             return False
         if auto_play:
             return self.play_track(track_num)
-        self.current_track = track_num
+        self._set_current_track(track_num)
         return True
 
     def get_current_track_index(self):
         return self.current_track - 1 if self.current_track > 0 else -1
 
-    def get_track_count(self):
-        return len(self.tracks)
-
     def get_state(self) -> PlayerState:
         return self.state
 
@@ -346,39 +512,28 @@ class DirectCDPlayer(AudioTransport):
             if not self._playback_started:
                 return 0.0
 
-            now = time.time()
-            if now - self._last_position_update < 0.2:
-                return self._cached_position
+            if self._clock.age() < self.CLOCK_RESYNC:
+                return self._clock.now()
 
             pos = self._get_property("time-pos")
-            if pos is not None:
-                chapter_start = self._get_chapter_start(self.current_track)
-                track_pos = pos - chapter_start
-                if track_pos >= 0:
-                    self._cached_position = track_pos
-                    self._last_position_update = now
-                    return track_pos
+            # a time-pos past the boundary belongs to the next track until the chapter event lands
+            if pos is not None and self._track_at(pos) == self.current_track:
+                track_pos = pos - self._chapter_start
+                self._clock.resync(track_pos, 1.0)
+                return track_pos
 
-            return self._cached_position
+            return self._clock.now()
         elif self.state == PlayerState.PAUSED:
-            return self._pause_time
-        return 0.0
-
-    def get_duration(self) -> float:
-        if self.current_track < 1 or self.current_track > len(self.tracks):
-            return 0.0
-        track_info = self.tracks[self.current_track - 1]
-        if hasattr(track_info, 'duration_seconds'):
-            return track_info.duration_seconds
+            return self._clock.now()
         return 0.0
 
     def seek(self, position_seconds: float) -> None:
         if self.current_track < 1 or self.state == PlayerState.STOPPED:
             return
-        chapter_start = self._get_chapter_start(self.current_track)
-        absolute_pos = chapter_start + position_seconds
+        absolute_pos = self._chapter_start + position_seconds
         self._send_ipc(["seek", absolute_pos, "absolute"])
-        logger.debug(f"STREAM: seek {position_seconds:.1f}s")
+        self._clock.resync(position_seconds, 1.0 if self.state == PlayerState.PLAYING else 0.0)
+        logger.debug("STREAM: seek %.1fs", position_seconds)
 
     def cleanup(self):
         self._stop_monitor_thread()
@@ -412,7 +567,7 @@ class DirectCDPlayer(AudioTransport):
                 pass
             self._ipc_socket = None
 
-        if hasattr(self, '_ipc_dir') and self._ipc_dir:
+        if self._ipc_dir:
             try:
                 os.rmdir(self._ipc_dir)
             except Exception:
@@ -420,4 +575,5 @@ class DirectCDPlayer(AudioTransport):
             self._ipc_dir = None
 
         self._cd_loaded_in_mpv = False
+        self._callback_pool.shutdown(wait=False)
         logger.debug("STREAM: cleanup done")
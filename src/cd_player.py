@@ -2,6 +2,7 @@ import alsaaudio
 import threading
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 import config
 from audio_transport import AudioTransport, PlayerState
@@ -11,7 +12,20 @@ logger = logging.getLogger(__name__)
 
 class BitPerfectPlayer(AudioTransport):
 
+    __slots__ = (
+        'device', 'state', 'pcm', '_alsa_initialized',
+        'current_data', 'current_position', 'total_size', 'next_track_data',
+        'play_thread', 'stop_event', 'pause_event', 'on_position_change',
+        '_chunks_written', '_underruns', '_last_write_time',
+        '_data_provider', '_current_track_index', '_next_track_index',
+        '_prefetched', '_prefetch_lock', '_prefetch_worker',
+    )
+
+    # seconds before end of track at which the next track is fetched
+    PREFETCH_LEAD = 5.0
+
     def __init__(self, device: str = None, data_provider=None, track_count: int = 0):
+        super().__init__()
         self.device = device or config.ALSA_DEVICE
         self.state = PlayerState.STOPPED
         self.pcm: Optional[alsaaudio.PCM] = None
@@ -28,7 +42,6 @@ class BitPerfectPlayer(AudioTransport):
         self.pause_event = threading.Event()
 
         self.on_position_change: Optional[Callable] = None
-        self.on_track_end: Optional[Callable] = None
 
         self._chunks_written = 0
         self._underruns = 0
@@ -39,7 +52,30 @@ class BitPerfectPlayer(AudioTransport):
         self._track_count = track_count
         self._next_track_index = -1
 
-        logger.debug(f"PLAYER: device={self.device}")
+        # guards next_track_data/_next_track_index/_prefetched across the
+        # playback loop, prepare_next callers and the prefetch worker
+        self._prefetched = True
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PCM-Prefetch")
+
+        logger.debug("PLAYER: device=%s", self.device)
+
+    def reconfigure(self, data_provider=None, track_count: int = 0):
+        # new disc, same device: keeps the ALSA handle and threading primitives
+        self.stop()
+        self.current_data = None
+        self.current_position = 0
+        self.total_size = 0
+        with self._prefetch_lock:
+            self.next_track_data = None
+            self._next_track_index = -1
+            self._prefetched = True
+        self._data_provider = data_provider
+        self._track_count = track_count
+        self._current_track_index = -1
+        self._duration_seconds = 0.0
+        self._chunks_written = 0
+        self._underruns = 0
 
     def _ensure_alsa(self):
         if self._alsa_initialized and self.pcm:
@@ -103,7 +139,8 @@ class BitPerfectPlayer(AudioTransport):
         self.current_data = pcm_data
         self.current_position = 0
         self.total_size = len(pcm_data)
-        logger.debug(f"PLAYER: loaded {self.total_size} bytes ({self.get_duration():.1f}s)")
+        self._duration_seconds = self.total_size / self._bytes_per_second()
+        logger.debug("PLAYER: loaded %d bytes (%.1fs)", self.total_size, self.get_duration())
 
     def preload_next_track(self, pcm_data: bytes):
         self.next_track_data = pcm_data
@@ -159,8 +196,7 @@ class BitPerfectPlayer(AudioTransport):
         if not self.current_data:
             return
 
-        bytes_per_second = config.SAMPLE_RATE * config.CHANNELS * (config.BIT_DEPTH // 8)
-        new_position = int(position_seconds * bytes_per_second)
+        new_position = int(position_seconds * self._bytes_per_second())
         new_position = (new_position // 4) * 4
 
         if 0 <= new_position < self.total_size:
@@ -169,14 +205,11 @@ class BitPerfectPlayer(AudioTransport):
             self.current_position = new_position
             if was_playing:
                 self.play()
-            logger.debug(f"PLAYER: seek to {position_seconds:.1f}s")
+            logger.debug("PLAYER: seek to %.1fs", position_seconds)
 
     def _playback_loop(self):
-        loop_start = time.time()
-
         try:
             chunk_size = config.PERIOD_SIZE * 4
-            bytes_per_second = config.SAMPLE_RATE * config.CHANNELS * 2
 
             while not self.stop_event.is_set():
                 self.pause_event.wait()
@@ -185,20 +218,24 @@ class BitPerfectPlayer(AudioTransport):
                     break
 
                 if self.current_position >= self.total_size:
-                    if self.next_track_data:
-                        self.current_data = self.next_track_data
-                        self.current_position = 0
-                        self.total_size = len(self.next_track_data)
+                    with self._prefetch_lock:
+                        next_data = self.next_track_data
+                        next_index = self._next_track_index
+                        # consumed: a later prepare_next for the same index (repeat) must fetch again
                         self.next_track_data = None
-                        self._current_track_index = self._next_track_index
+                        self._next_track_index = -1
+                    if next_data:
+                        self.current_data = next_data
+                        self.current_position = 0
+                        self.total_size = len(next_data)
+                        self._duration_seconds = self.total_size / self._bytes_per_second()
+                        self._current_track_index = next_index
 
-                        if self.on_track_end:
-                            threading.Thread(target=self.on_track_end, daemon=True, name="TrackEndCB").start()
+                        threading.Thread(target=self.on_track_end, daemon=True, name="TrackEndCB").start()
                         continue
                     else:
                         self.state = PlayerState.STOPPED
-                        if self.on_track_end:
-                            threading.Thread(target=self.on_track_end, daemon=True, name="TrackEndCB").start()
+                        threading.Thread(target=self.on_track_end, daemon=True, name="TrackEndCB").start()
                         break
 
                 remaining = self.total_size - self.current_position
@@ -207,7 +244,7 @@ class BitPerfectPlayer(AudioTransport):
 
                 try:
                     write_start = time.time()
-                    frames_written = self.pcm.write(data)
+                    self.pcm.write(data)
                     write_time = (time.time() - write_start) * 1000
 
                     self._chunks_written += 1
@@ -230,6 +267,9 @@ class BitPerfectPlayer(AudioTransport):
 
                 self.current_position += len(data)
 
+                if not self._prefetched:
+                    self._maybe_prefetch()
+
                 if self.on_position_change:
                     self.on_position_change(self.get_position())
 
@@ -237,17 +277,14 @@ class BitPerfectPlayer(AudioTransport):
             logger.error(f"PLAYER: playback err: {e}")
             self.state = PlayerState.STOPPED
 
-    def get_position(self) -> float:
-        if not self.current_data:
-            return 0.0
-        bytes_per_second = config.SAMPLE_RATE * config.CHANNELS * (config.BIT_DEPTH // 8)
-        return self.current_position / bytes_per_second
+    @staticmethod
+    def _bytes_per_second() -> int:
+        return config.SAMPLE_RATE * config.CHANNELS * (config.BIT_DEPTH // 8)
 
-    def get_duration(self) -> float:
+    def get_position(self) -> float:
         if not self.current_data:
             return 0.0
-        bytes_per_second = config.SAMPLE_RATE * config.CHANNELS * (config.BIT_DEPTH // 8)
-        return self.total_size / bytes_per_second
+        return self.current_position / self._bytes_per_second()
 
     def get_state(self) -> PlayerState:
         return self.state
@@ -255,32 +292,56 @@ class BitPerfectPlayer(AudioTransport):
     def navigate_to(self, track_index, auto_play=True):
         if not self._data_provider:
             return False
-        pcm_data = self._data_provider(track_index + 1)  # provider uses 1-based
+        pcm_data = self.next_track_data if track_index == self._next_track_index else None
+        if not pcm_data:
+            pcm_data = self._data_provider(track_index + 1)  # provider uses 1-based
         if not pcm_data:
             return False
         self.load_pcm_data(pcm_data)
         self._current_track_index = track_index
+        with self._prefetch_lock:
+            self.next_track_data = None
+            self._next_track_index = -1
+            self._prefetched = True
         if auto_play:
             self.play()
         return True
 
     def prepare_next(self, track_index):
+        # only records the target; PCM is read PREFETCH_LEAD seconds before
+        # the end of the current track (see _maybe_prefetch)
         if not self._data_provider:
             return
-        if track_index < 0:
-            self.preload_next_track(None)
-            self._next_track_index = -1
+        with self._prefetch_lock:
+            # same target: already waiting, in flight or loaded
+            if track_index >= 0 and track_index == self._next_track_index:
+                return
+            self.next_track_data = None
+            self._next_track_index = track_index
+            self._prefetched = track_index < 0
+        self._maybe_prefetch()
+
+    def _maybe_prefetch(self):
+        if self._duration_seconds - self.get_position() >= self.PREFETCH_LEAD:
             return
+        with self._prefetch_lock:
+            if self._prefetched:
+                return
+            self._prefetched = True
+            track_index = self._next_track_index
+        self._prefetch_worker.submit(self._load_next, track_index)
+
+    def _load_next(self, track_index):
         pcm_data = self._data_provider(track_index + 1)
-        self.preload_next_track(pcm_data)
-        self._next_track_index = track_index
+        with self._prefetch_lock:
+            if self._next_track_index != track_index:
+                return
+            self.next_track_data = pcm_data
+        logger.debug("PLAYER: prefetched track %d", track_index + 1)
 
     def get_current_track_index(self):
         return self._current_track_index
 
-    def get_track_count(self):
-        return self._track_count
-
     def get_stats(self) -> dict:
         return {
             'state': self.state.name,
@@ -293,6 +354,7 @@ class BitPerfectPlayer(AudioTransport):
 
     def cleanup(self):
         self.stop()
+        self._prefetch_worker.shutdown(wait=False, cancel_futures=True)
         if self.pcm:
             try:
                 self.pcm.close()
@@ -4,12 +4,21 @@ import re
 import logging
 import time
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import List, Optional, Callable
 import config
+from audio_transport import _noop
 
 logger = logging.getLogger(__name__)
 
 
+def _file_size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return -1
+
+
 @dataclass
 class CDTrack:
     number: int
@@ -20,6 +29,7 @@ class CDTrack:
     filename: str = ""
     title: str = ""
     artist: str = ""
+    filepath: str = ""
 
     def __str__(self):
         mins = int(self.duration_seconds // 60)
@@ -35,10 +45,12 @@ class CDRipper:
         self.device = device or config.CD_DEVICE
         self.ram_path = ram_path or config.RAM_PATH
         self.tracks: List[CDTrack] = []
+        self.total_duration: float = 0.0
         self.disc_id: Optional[str] = None
         self.disc_title: str = ""
         self.disc_artist: str = ""
         self.extraction_level: int = config.DEFAULT_EXTRACTION_LEVEL
+        self.total_ripped_bytes: int = 0
 
         logger.debug(f"RIPPER: initialized device={self.device}, ram_path={self.ram_path}")
 
@@ -121,19 +133,21 @@ class CDRipper:
 
                 length = end_sector - track_info['start_sector'] + 1
 
+                filename = f"track{track_info['number']:02d}.wav"
                 track = CDTrack(
                     number=track_info['number'],
                     start_sector=track_info['start_sector'],
                     end_sector=end_sector,
                     length_sectors=length,
                     duration_seconds=track_info['duration'],
-                    filename=f"track{track_info['number']:02d}.wav"
+                    filename=filename,
+                    filepath=os.path.join(self.ram_path, filename)
                 )
                 self.tracks.append(track)
 
             elapsed = (time.time() - start_time) * 1000
-            total_duration = sum(t.duration_seconds for t in self.tracks)
-            logger.info(f"RIPPER: TOC read in {elapsed:.0f}ms - {len(self.tracks)} tracks, {total_duration:.0f}s total")
+            self.total_duration = sum(map(attrgetter('duration_seconds'), self.tracks))
+            logger.info(f"RIPPER: TOC read in {elapsed:.0f}ms - {len(self.tracks)} tracks, {self.total_duration:.0f}s total")
 
             for track in self.tracks:
                 logger.debug(f"RIPPER: track {track.number:02d} - {track.duration_seconds:.1f}s ({track.length_sectors} sectors)")
@@ -252,29 +266,31 @@ class CDRipper:
         os.makedirs(self.ram_path, exist_ok=True)
 
         level_info = self.get_extraction_level_info()
-        total_duration = sum(t.duration_seconds for t in self.tracks)
+        total_duration = self.total_duration
 
         logger.info(f"RIPPER: starting extraction of {len(self.tracks)} tracks ({total_duration:.0f}s) to {self.ram_path}")
         logger.info(f"RIPPER: mode=level {self.extraction_level} ({level_info['name']}), tool=cdparanoia, timeout={level_info['timeout']}s")
 
         extraction_start = time.time()
+        self.total_ripped_bytes = 0
+        progress_callback = progress_callback or _noop
 
         for track in self.tracks:
-            output_file = os.path.join(self.ram_path, track.filename)
+            output_file = track.filepath
             success = False
 
             for attempt in range(max_retries):
                 try:
                     track_start = time.time()
 
-                    if progress_callback:
-                        status = "extracting" if attempt == 0 else f"retry {attempt}"
-                        progress_callback(track.number, len(self.tracks), status)
+                    status = "extracting" if attempt == 0 else f"retry {attempt}"
+                    progress_callback(track.number, len(self.tracks), status)
 
                     success = self._rip_track_cdparanoia(track, output_file, level_info)
 
-                    if success and os.path.exists(output_file):
-                        file_size = os.path.getsize(output_file)
+                    file_size = _file_size(output_file) if success else -1
+                    if file_size >= 0:
+                        self.total_ripped_bytes += file_size
                         track_elapsed = time.time() - track_start
                         speed = track.duration_seconds / track_elapsed if track_elapsed > 0 else 0
                         logger.info(f"RIPPER: track {track.number:02d} extracted in {track_elapsed:.1f}s ({file_size/1024/1024:.1f}MB, {speed:.1f}x)")
@@ -294,11 +310,10 @@ class CDRipper:
                 logger.error(f"RIPPER: track {track.number} failed after {max_retries} attempts")
                 return False
 
-        if progress_callback:
-            progress_callback(len(self.tracks), len(self.tracks), "complete")
+        progress_callback(len(self.tracks), len(self.tracks), "complete")
 
         total_elapsed = time.time() - extraction_start
-        total_size = sum(os.path.getsize(os.path.join(self.ram_path, t.filename)) for t in self.tracks)
+        total_size = self.total_ripped_bytes
         avg_speed = total_duration / total_elapsed if total_elapsed > 0 else 0
 
         logger.info(f"RIPPER: extraction complete in {total_elapsed:.1f}s ({total_size/1024/1024:.0f}MB, avg {avg_speed:.1f}x)")
@@ -310,23 +325,22 @@ class CDRipper:
             return None
 
         track = self.tracks[track_num - 1]
-        filepath = os.path.join(self.ram_path, track.filename)
-
-        if not os.path.exists(filepath):
-            logger.error(f"RIPPER: file not found: {filepath}")
-            return None
+        filepath = track.filepath
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             with open(filepath, 'rb') as f:
                 f.seek(44)
                 pcm_data = f.read()
 
-            elapsed = (time.time() - start_time) * 1000
-            logger.debug(f"RIPPER: track {track_num} loaded in {elapsed:.1f}ms - {len(pcm_data)} bytes")
+            logger.debug("RIPPER: track %d loaded in %.1fms - %d bytes",
+                         track_num, (time.perf_counter() - start_time) * 1000, len(pcm_data))
             return pcm_data
 
+        except FileNotFoundError:
+            logger.error(f"RIPPER: file not found: {filepath}")
+            return None
         except Exception as e:
             logger.error(f"RIPPER: failed to load track {track_num}: {e}")
             return None
@@ -336,21 +350,18 @@ class CDRipper:
             return None
         return self.tracks[track_num - 1]
 
-    def _get_track_filepath(self, track_num: int) -> str:
-        if track_num < 1 or track_num > len(self.tracks):
-            return ""
-        track = self.tracks[track_num - 1]
-        return os.path.join(self.ram_path, track.filename)
-
     def cleanup(self):
         logger.debug("RIPPER: cleanup starting...")
         removed = 0
+        self.total_ripped_bytes = 0
         try:
             for track in self.tracks:
-                filepath = os.path.join(self.ram_path, track.filename)
-                if os.path.exists(filepath):
+                filepath = track.filepath
+                try:
                     os.remove(filepath)
                     removed += 1
+                except FileNotFoundError:
+                    pass
             logger.info(f"RIPPER: cleanup complete - removed {removed} files")
         except Exception as e:
             logger.error(f"RIPPER: cleanup error: {e}")
@@ -155,6 +155,8 @@ VERIFY_SAMPLE_RATE = True
 VERIFY_VOLUME = True
 
 RAM_SAFETY_MARGIN = 0.15
+# share of the RAM left over after extraction used to keep decoded tracks in memory
+PCM_CACHE_FRACTION = 0.2
 
 # override defaults from config/settings.json
 _settings = _load_settings()
@@ -6,6 +6,7 @@ Mostra como integrar LED controller com o sistema completo
 
 import logging
 from cd_controller import CDPlayerController
+from audio_transport import PLAYING, PAUSED
 from led_controller import setup_led_controller, LEDStatus
 from gpio_controller import GPIOController
 import config
@@ -84,10 +85,10 @@ def main():
             # Verificar status periodicamente
             if controller.is_cd_loaded():
                 state = controller.get_state()
-                if state.value == 1:  # PLAYING
+                if state is PLAYING:
                     if led:
                         led.on_playback_state(True, False)
-                elif state.value == 2:  # PAUSED
+                elif state is PAUSED:
                     if led:
                         led.on_playback_state(False, True)
             
@@ -3,6 +3,7 @@ GPIO controller for physical buttons using gpiozero
 """
 
 import logging
+import threading
 from typing import Optional, Callable, Dict
 import config
 
@@ -92,7 +93,6 @@ class GPIOController:
                 def progress_cb(track_num, total_tracks, status):
                     logger.debug(f"loading: {status} - track {track_num}/{total_tracks}")
 
-                import threading
                 def load_thread():
                     self.controller.load(progress_cb)
 
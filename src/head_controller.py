@@ -5,6 +5,8 @@ import glob
 import threading
 import logging
 from typing import Optional, Callable
+from audio_transport import PlayerState
+from track_sequencer import RepeatMode
 
 logger = logging.getLogger(__name__)
 
@@ -302,25 +304,22 @@ class HeadStateBuilder:
 
     @staticmethod
     def build_state(controller) -> dict:
-        from cd_player import PlayerState
-        from cd_controller import RepeatMode
-
         state_map = {
             PlayerState.PLAYING: 'P',
             PlayerState.PAUSED: 'U',
             PlayerState.STOPPED: 'S'
         }
 
+        state, position, duration = controller.snapshot()
+
         if getattr(controller, '_transitioning', False):
             if getattr(controller, '_transition_was_playing', False):
                 player_state = 'P'
             else:
                 player_state = 'U'
         else:
-            player_state = state_map.get(controller.get_state(), 'S')
+            player_state = state_map.get(state, 'S')
 
-        position = controller.get_position()
-        duration = controller.get_duration()
         total_duration = controller.get_total_duration()
 
         repeat_mode = controller.repeat_mode
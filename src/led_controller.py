@@ -2,6 +2,7 @@ import logging
 import threading
 import time
 from typing import Optional, Tuple
+from audio_transport import PLAYING, PAUSED
 import config
 
 logger = logging.getLogger(__name__)
@@ -193,9 +194,6 @@ class NeopixelController:
 
 
 def setup_led_controller(controller) -> Optional[NeopixelController]:
-    import time
-    from cd_player import PlayerState
-
     led = NeopixelController()
 
     if not led.is_enabled():
@@ -211,8 +209,8 @@ def setup_led_controller(controller) -> Optional[NeopixelController]:
             try:
                 state = controller.get_state()
                 led.on_playback_state(
-                    state == PlayerState.PLAYING,
-                    state == PlayerState.PAUSED,
+                    state == PLAYING,
+                    state == PAUSED,
                     controller.is_cd_loaded()
                 )
                 time.sleep(0.5)
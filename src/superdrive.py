@@ -1,3 +1,4 @@
+import os
 import subprocess
 import logging
 import time
@@ -17,7 +18,6 @@ class SuperDriveController:
         self.model = None
 
     def detect(self) -> bool:
-        import os
         if not os.path.exists(self.device):
             logger.debug(f"device {self.device} not found")
             return False
@@ -2,7 +2,8 @@ import time
 import threading
 import config
 from cd_controller import CDPlayerController
-from cd_player import PlayerState
+from audio_transport import PlayerState
+from track_sequencer import RepeatMode
 from head_controller import HeadController, HeadStateBuilder
 import logging
 
@@ -54,11 +55,9 @@ class TerminalUI:
             return
 
         try:
-            from cd_controller import RepeatMode
-            state = self.controller.get_state()
+            state, position, duration = self.controller.snapshot()
             track_num = self.controller.get_current_track_num()
             total_tracks = self.controller.get_total_tracks()
-            position = self.controller.get_position()
 
             state_symbol = {
                 PlayerState.PLAYING: "\033[0;32m▸\033[0m",
@@ -90,7 +89,6 @@ class TerminalUI:
                     f"{indicator_str}"
                 )
             else:
-                duration = self.controller.get_duration()
                 pos_min = int(position // 60)
                 pos_sec = int(position % 60)
                 dur_min = int(duration // 60)
@@ -490,7 +488,6 @@ class TerminalUI:
                         if not self.controller.is_cd_loaded():
                             print("\033[0;31m✗\033[0m no cd loaded")
                         else:
-                            from cd_controller import RepeatMode
                             mode = self.controller.repeat()
                             mode_display = {
                                 RepeatMode.OFF: "off",
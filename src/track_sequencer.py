@@ -14,6 +14,9 @@ class RepeatMode(Enum):
 
 class TrackSequencer:
 
+    # indexed by RepeatMode.value: OFF -> TRACK -> ALL -> OFF
+    _REPEAT_NEXT = (RepeatMode.TRACK, RepeatMode.ALL, RepeatMode.OFF)
+
     def __init__(self):
         self.repeat_mode: RepeatMode = RepeatMode.OFF
         self.shuffle_on: bool = False
@@ -48,7 +51,7 @@ class TrackSequencer:
                     self._shuffle_position = self._shuffle_playlist.index(value)
                 except ValueError:
                     pass
-            logger.debug(f"SEQ: index {value}")
+            logger.debug("SEQ: index %d", value)
 
     def next_track(self) -> Optional[int]:
         if self._total_tracks == 0:
@@ -94,7 +97,7 @@ class TrackSequencer:
                 self._shuffle_position += 1
                 if self._shuffle_position >= len(self._shuffle_playlist):
                     self._shuffle_position = 0
-            logger.debug(f"SEQ: → track {next_idx + 1}")
+            logger.debug("SEQ: → track %d", next_idx + 1)
         return next_idx
 
     def retreat(self) -> Optional[int]:
@@ -103,7 +106,7 @@ class TrackSequencer:
             self._current_index = prev_idx
             if self.shuffle_on:
                 self._shuffle_position = max(0, self._shuffle_position - 1)
-            logger.debug(f"SEQ: ← track {prev_idx + 1}")
+            logger.debug("SEQ: ← track %d", prev_idx + 1)
         return prev_idx
 
     def goto(self, index: int) -> bool:
@@ -114,7 +117,7 @@ class TrackSequencer:
                     self._shuffle_position = self._shuffle_playlist.index(index)
                 except ValueError:
                     pass
-            logger.debug(f"SEQ: goto track {index + 1}")
+            logger.debug("SEQ: goto track %d", index + 1)
             return True
         logger.warning(f"SEQ: invalid index {index}")
         return False
@@ -127,7 +130,8 @@ class TrackSequencer:
                 self._shuffle_position = self._shuffle_playlist.index(self._current_index)
             except ValueError:
                 self._shuffle_position = 0
-            logger.info(f"SEQ: shuffle ON {[i+1 for i in self._shuffle_playlist]}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"SEQ: shuffle ON {[i+1 for i in self._shuffle_playlist]}")
         else:
             self._shuffle_playlist = []
             self._shuffle_position = 0
@@ -135,12 +139,7 @@ class TrackSequencer:
         return self.shuffle_on
 
     def cycle_repeat(self) -> RepeatMode:
-        if self.repeat_mode == RepeatMode.OFF:
-            self.repeat_mode = RepeatMode.TRACK
-        elif self.repeat_mode == RepeatMode.TRACK:
-            self.repeat_mode = RepeatMode.ALL
-        else:
-            self.repeat_mode = RepeatMode.OFF
+        self.repeat_mode = self._REPEAT_NEXT[self.repeat_mode.value]
         logger.info(f"SEQ: repeat {self.repeat_mode.name}")
         return self.repeat_mode
 
@@ -174,6 +173,5 @@ class TrackSequencer:
         if self._total_tracks == 0:
             self._shuffle_playlist = []
             return
-        self._shuffle_playlist = list(range(self._total_tracks))
-        random.shuffle(self._shuffle_playlist)
+        self._shuffle_playlist = random.sample(range(self._total_tracks), self._total_tracks)
         self._shuffle_position = 0
@@ -0,0 +1,69 @@
+"""
+python3 -m pytest tests/test_controller.py -v
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+sys.path.insert(0, '/home/pi/redram/src')
+
+from cd_controller import CDPlayerController
+
+
+class FakeRipper:
+
+    def __init__(self, sizes):
+        self.sizes = sizes
+        self.loads = []
+
+    def load_track_data(self, track_num):
+        self.loads.append(track_num)
+        size = self.sizes.get(track_num)
+        return None if size is None else bytes(size)
+
+
+def make_controller(sizes, budget):
+    ctl = CDPlayerController.__new__(CDPlayerController)
+    ctl.ripper = FakeRipper(sizes)
+    ctl._pcm_cache = OrderedDict()
+    ctl._pcm_cache_bytes = 0
+    ctl._pcm_cache_budget = budget
+    ctl._pcm_cache_lock = threading.Lock()
+    return ctl
+
+
+class TestPcmCache:
+
+    def test_hit_skips_reload(self):
+        ctl = make_controller({1: 10}, budget=100)
+        assert len(ctl._get_pcm(1)) == 10
+        assert len(ctl._get_pcm(1)) == 10
+        assert ctl.ripper.loads == [1]
+
+    def test_evicts_least_recently_used(self):
+        ctl = make_controller({1: 40, 2: 40, 3: 40}, budget=100)
+        ctl._get_pcm(1)
+        ctl._get_pcm(2)
+        ctl._get_pcm(1)
+        ctl._get_pcm(3)
+        assert list(ctl._pcm_cache) == [1, 3]
+        assert ctl._pcm_cache_bytes == 80
+
+    def test_track_over_budget_not_cached(self):
+        ctl = make_controller({1: 40, 2: 150}, budget=100)
+        ctl._get_pcm(1)
+        assert len(ctl._get_pcm(2)) == 150
+        assert list(ctl._pcm_cache) == [1]
+        assert ctl._pcm_cache_bytes == 40
+
+    def test_missing_track_not_cached(self):
+        ctl = make_controller({}, budget=100)
+        assert ctl._get_pcm(1) is None
+        assert not ctl._pcm_cache
+
+    def test_clear_resets_bytes(self):
+        ctl = make_controller({1: 40}, budget=100)
+        ctl._get_pcm(1)
+        ctl._clear_pcm_cache()
+        assert not ctl._pcm_cache
+        assert ctl._pcm_cache_bytes == 0
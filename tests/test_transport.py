@@ -4,6 +4,7 @@ python3 -m pytest tests/test_transport.py -v
 
 import pytest
 import sys
+import time
 sys.path.insert(0, '/home/pi/redram/src')
 
 from audio_transport import AudioTransport, PlayerState
@@ -24,6 +25,29 @@ class TestPlayerStateEnum:
         assert PlayerState.PAUSED.name == 'PAUSED'
 
 
+class TestAudioTransportBase:
+
+    def test_cannot_instantiate_base(self):
+        with pytest.raises(TypeError):
+            AudioTransport()
+
+    def test_plain_metaclass(self):
+        from abc import ABCMeta
+        assert not isinstance(AudioTransport, ABCMeta)
+
+    def test_transports_have_no_instance_dict(self):
+        player = DirectCDPlayer(tracks=[])
+        assert not hasattr(player, '__dict__')
+        assert callable(player.on_track_end)
+
+    def test_incomplete_subclass_rejected(self):
+        class Partial(AudioTransport):
+            def play(self): pass
+
+        with pytest.raises(TypeError):
+            Partial()
+
+
 class TestBitPerfectPlayerConformance:
 
     def test_inherits_audio_transport(self):
@@ -69,6 +93,120 @@ class TestBitPerfectPlayerConformance:
         except Exception:
             pytest.skip("ALSA not available")
 
+    def test_prepare_next_prefetches_near_end(self):
+        fake_pcm = b'\x00' * 1000
+        provider = lambda track_num: fake_pcm
+
+        player = BitPerfectPlayer(data_provider=provider, track_count=3)
+        player.navigate_to(0, auto_play=False)
+        player.prepare_next(1)
+        for _ in range(50):
+            if player.next_track_data:
+                break
+            time.sleep(0.01)
+        assert player.next_track_data == fake_pcm
+
+    def test_navigate_to_reuses_prefetched_track(self):
+        calls = []
+        def provider(track_num):
+            calls.append(track_num)
+            return bytes([track_num]) * 1000
+
+        player = BitPerfectPlayer(data_provider=provider, track_count=3)
+        player.navigate_to(0, auto_play=False)
+        player.prepare_next(1)
+        for _ in range(50):
+            if player.next_track_data:
+                break
+            time.sleep(0.01)
+        calls.clear()
+        assert player.navigate_to(1, auto_play=False) is True
+        assert calls == []
+        assert player.current_data == bytes([2]) * 1000
+
+    def test_prepare_next_same_track_keeps_prefetch(self):
+        calls = []
+        def provider(track_num):
+            calls.append(track_num)
+            return b'\x00' * 1000
+
+        player = BitPerfectPlayer(data_provider=provider, track_count=3)
+        player.navigate_to(0, auto_play=False)
+        player.prepare_next(1)
+        for _ in range(50):
+            if player.next_track_data:
+                break
+            time.sleep(0.01)
+        player.prepare_next(1)
+        assert player.next_track_data is not None
+        assert calls == [1, 2]
+
+    def test_repeat_track_survives_two_boundaries(self):
+        class SlowPCM:
+            def write(self, data):
+                time.sleep(0.02)
+            def pause(self, flag):
+                pass
+
+        track = b'\x00' * (4096 * 4 * 3)
+        player = BitPerfectPlayer(data_provider=lambda n: track, track_count=1)
+        player.pcm = SlowPCM()
+        player._alsa_initialized = True
+        ends = []
+
+        def on_track_end():
+            ends.append((player.get_state(), player.get_current_track_index()))
+            if len(ends) < 3:
+                player.prepare_next(0)
+
+        player.on_track_end = on_track_end
+        player.navigate_to(0, auto_play=False)
+        player.prepare_next(0)
+        for _ in range(50):
+            if player.next_track_data:
+                break
+            time.sleep(0.01)
+        player.play()
+        for _ in range(200):
+            if len(ends) >= 3:
+                break
+            time.sleep(0.01)
+        player.stop()
+        assert ends[:2] == [(PlayerState.PLAYING, 0), (PlayerState.PLAYING, 0)]
+
+    def test_prepare_next_during_prefetch_reads_once(self):
+        import threading
+        calls = []
+        release = threading.Event()
+        def provider(track_num):
+            calls.append(track_num)
+            if track_num == 2:
+                release.wait(1.0)
+            return b'\x00' * 1000
+
+        player = BitPerfectPlayer(data_provider=provider, track_count=3)
+        player.navigate_to(0, auto_play=False)
+        player.prepare_next(1)
+        player.prepare_next(1)
+        release.set()
+        for _ in range(50):
+            if player.next_track_data:
+                break
+            time.sleep(0.01)
+        assert player.next_track_data is not None
+        assert calls == [1, 2]
+
+    def test_reconfigure_resets_disc_state(self):
+        player = BitPerfectPlayer(data_provider=lambda n: b'\x00' * 1000, track_count=3)
+        player.navigate_to(1, auto_play=False)
+        player.reconfigure(data_provider=lambda n: b'\x01' * 2000, track_count=5)
+        assert player.get_track_count() == 5
+        assert player.get_current_track_index() == -1
+        assert player.current_data is None
+        assert player.get_duration() == 0.0
+        assert player.navigate_to(0, auto_play=False) is True
+        assert player.total_size == 2000
+
     def test_navigate_to_without_data_provider(self):
         try:
             player = BitPerfectPlayer()
@@ -144,6 +282,13 @@ class TestDirectCDPlayerConformance:
         player.navigate_to(1, auto_play=False)
         assert player.get_current_track_index() == 1
 
+    def test_get_duration_follows_navigation(self):
+        player = DirectCDPlayer(tracks=[MockTrack(), MockTrack()])
+        assert player.get_duration() == 0.0
+
+        player.navigate_to(1, auto_play=False)
+        assert player.get_duration() == 180.0
+
     def test_get_track_count(self):
         player = DirectCDPlayer(tracks=[MockTrack(), MockTrack(), MockTrack()])
         assert player.get_track_count() == 3
@@ -151,10 +296,58 @@ class TestDirectCDPlayerConformance:
         player = DirectCDPlayer(tracks=[])
         assert player.get_track_count() == 0
 
+    def test_track_at_maps_disc_position(self):
+        player = DirectCDPlayer(tracks=[MockTrack(), MockTrack(), MockTrack()])
+        assert player._track_at(0.0) == 1
+        assert player._track_at(179.9) == 1
+        assert player._track_at(180.0) == 2
+        assert player._track_at(10_000.0) == 3
+
+    def test_ipc_reply_skips_interleaved_events(self):
+        import socket
+        player = DirectCDPlayer(tracks=[])
+        conn, mpv = socket.socketpair()
+        player._ipc_socket = 'unused'
+        player._ipc_conn = conn
+        mpv.sendall(b'{"event":"start-file"}\n{"data":1.5,"error":"success"}\n{"data":2,')
+        assert player._get_property("time-pos") == 1.5
+        mpv.sendall(b'"error":"success"}\n')
+        assert player._get_property("chapter") == 2
+        assert not player._ipc_buf
+        mpv.close()
+        assert player._send_ipc(["stop"])["error"] != "success"
+        assert player._ipc_conn is None
+
+    def test_ipc_waits_for_event_after_reply(self):
+        import socket
+        player = DirectCDPlayer(tracks=[])
+        conn, mpv = socket.socketpair()
+        player._ipc_socket = 'unused'
+        player._ipc_conn = conn
+        mpv.sendall(b'{"error":"success"}\n{"event":"start-file"}\n{"event":"file-loaded"}\n')
+        assert player._send_ipc_until(["loadfile", "cdda://"], "file-loaded", 1.0)["error"] == "success"
+        assert not player._ipc_buf
+
+        mpv.sendall(b'{"error":"success"}\n')
+        start = time.monotonic()
+        assert player._send_ipc_until(["loadfile", "cdda://"], "file-loaded", 0.05)["error"] == "success"
+        assert time.monotonic() - start < 0.5
+        assert player._ipc_conn is conn
+        mpv.close()
+        conn.close()
+
     def test_has_play_method(self):
         player = DirectCDPlayer(tracks=[])
         assert callable(player.play)
 
+    def test_is_playing_follows_stop(self):
+        player = DirectCDPlayer(tracks=[MockTrack()])
+        player.state = PlayerState.PLAYING
+        assert player.is_playing() is True
+
+        player.stop()
+        assert player.is_playing() is False
+
 
 class TestInterfaceConsistency:
 